@@ -22,9 +22,8 @@ import importlib.metadata as importlib_metadata
 # Private Imports
 # -----------------------------------------------------------------------------
 
-from . import eos_dut
 from .eos_get_dut import plugin_get_dut
-from netcam_aioeos.config.eos_get_dcfg import plugin_get_dcfg
+from .config.eos_get_dcfg import plugin_get_dcfg
 from .eos_plugin_init import plugin_init
 
 
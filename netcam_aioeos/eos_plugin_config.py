@@ -17,13 +17,9 @@
 # -----------------------------------------------------------------------------
 
 from typing import Optional
-
-# -----------------------------------------------------------------------------
-# Public Imports
-# -----------------------------------------------------------------------------
-
-from pydantic import BaseModel, Extra
-from pydantic_env.models import EnvSecretStr
+from dataclasses import dataclass
+from functools import lru_cache
+from os.path import expandvars
 
 # -----------------------------------------------------------------------------
 # Exports
@@ -39,13 +35,36 @@ __all__ = ["EosPluginConfig"]
 
 
 # -----------------------------------------------------------------------------
-# Use pydantic models to validate the User configuration file.  Configure
-# pydantic to prevent the User from providing (accidentally) any fields that are
-# not specifically supported; via the Extra.forbid config.
+# Validate the User configuration file with lightweight frozen dataclasses.
+# The config schema is only a few string fields; hand-rolled key checking
+# avoids the pydantic-core schema compilation cost at import time.  Unknown
+# fields are still rejected, matching the prior Extra.forbid behavior.
 # -----------------------------------------------------------------------------
 
 
-class EosPluginEnvCreds(BaseModel, extra=Extra.forbid):
+@lru_cache(maxsize=16)
+def _expand_secret(field: str, value: str) -> str:
+    """
+    Resolve any environment variable reference in the given config value, for
+    example "$EOS_USERNAME".  Raises ValueError when the referenced variable
+    is not present in the environment.  Resolutions are memoized; the process
+    environment is treated as fixed for the process lifetime.
+    """
+    expanded = expandvars(value)
+    if "$" in expanded:
+        raise ValueError(f"{field}: environment variable not found: {value}")
+
+    return expanded
+
+
+def _check_keys(source: str, config: dict, allowed: set) -> None:
+    """Reject any config keys that are not specifically supported."""
+    if unknown := set(config) - allowed:
+        raise ValueError(f"{source}: unsupported fields: {', '.join(sorted(unknown))}")
+
+
+@dataclass(frozen=True)
+class EosPluginEnvCreds:
     """
     Define the environment variable names to source the username and password values.  When
     provided, these will override the default values.
@@ -55,17 +74,58 @@ class EosPluginEnvCreds(BaseModel, extra=Extra.forbid):
     parameters are optional.
     """
 
-    username: EnvSecretStr
-    password: EnvSecretStr
+    username: str
+    password: str
 
+    @classmethod
+    def from_config(cls, source: str, config: dict) -> "EosPluginEnvCreds":
+        _check_keys(source, config, {"username", "password"})
+        return cls(
+            username=_expand_secret(f"{source}.username", config["username"]),
+            password=_expand_secret(f"{source}.password", config["password"]),
+        )
 
-class EosPluginEnvConfig(BaseModel, extra=Extra.forbid):
+
+@dataclass(frozen=True)
+class EosPluginEnvConfig:
     read: EosPluginEnvCreds
     admin: Optional[EosPluginEnvCreds] = None
 
+    @classmethod
+    def from_config(cls, config: dict) -> "EosPluginEnvConfig":
+        _check_keys("env", config, {"read", "admin"})
+        return cls(
+            read=EosPluginEnvCreds.from_config("env.read", config["read"]),
+            admin=(
+                EosPluginEnvCreds.from_config("env.admin", admin)
+                if (admin := config.get("admin"))
+                else None
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class EosPluginConfig:
+    """
+    define the schema for the plugin configuration
 
-class EosPluginConfig(BaseModel, extra=Extra.forbid):
-    """define the schema for the plugin configuration"""
+    The optional `http2` flag enables HTTP/2 on the eAPI transport so that
+    the per-device CLI calls multiplex over a single connection.  Requires
+    the "h2" package to be installed (the netcam-aioeos[http2] extra).
+    """
 
     env: EosPluginEnvConfig
     timeout: int = 60
+    http2: bool = False
+
+    @classmethod
+    def from_config(cls, config: dict) -> "EosPluginConfig":
+        _check_keys("config", config, {"env", "timeout", "http2"})
+        try:
+            return cls(
+                env=EosPluginEnvConfig.from_config(config["env"]),
+                timeout=int(config.get("timeout", 60)),
+                http2=bool(config.get("http2", False)),
+            )
+        except KeyError as exc:
+            raise ValueError(f"missing required field: {exc.args[0]}")
@@ -24,11 +24,11 @@ from typing import Optional, Tuple
 
 import httpx
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from .eos_plugin_config import EosPluginConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class EosGlobals:
     """
     Define a class to encapsulate the global variables used by this plugin.
@@ -51,12 +51,22 @@ class EosGlobals:
     config: dict
         This is the plugin configuration dictionary as declared in the User
         `netcad.toml` configuration file.
+
+    client_limits: httpx.Limits
+        The connection-pool limits applied to every eAPI transport so that
+        fleet-wide check runs share keep-alive connections rather than
+        re-handshaking per request.
     """
 
     basic_auth: Optional[httpx.BasicAuth] = None
     basic_auth_rw: Optional[httpx.BasicAuth] = None
     config: Optional[EosPluginConfig] = None
     scp_creds: Optional[Tuple[str, str]] = None
+    client_limits: httpx.Limits = field(
+        default_factory=lambda: httpx.Limits(
+            max_keepalive_connections=64, max_connections=256
+        )
+    )
 
 
 # -----------------------------------------------------------------------------
@@ -49,6 +49,18 @@ __all__ = []
 #
 # -----------------------------------------------------------------------------
 
+# maps the check-result field name to the function that determines whether
+# the expected vs. measured values are an acceptable match.
+
+_FIELD_MATCHERS = {"device": nei_hostname_match, "port_id": nei_interface_match}
+
+
+def _on_mismatch(_field, _expd, _msrd):
+    """mismatch callback shared by every interface check; no per-call state"""
+    matcher = _FIELD_MATCHERS.get(_field)
+    is_ok = matcher(_expd, _msrd) if matcher else False
+    return CheckStatus.PASS if is_ok else CheckStatus.FAIL
+
 
 @EOSDeviceUnderTest.execute_checks.register  # noqa
 async def eos_check_cabling(
@@ -76,20 +88,35 @@ async def eos_check_cabling(
     device = dut.device
     results = list()
 
-    cli_lldp_rsp = await dut.eapi.cli("show lldp neighbors")
+    cli_lldp_rsp = await dut.get_lldp_neighbors()
+
+    # create a map of local interface name to the LLDP neighbor measurement
+    # fields.  The two fields are extracted into a tuple up front so the
+    # per-check loop avoids the dict item lookups per interface.
 
-    # create a map of local interface name to the LLDP neighbor record.
+    dev_lldpnei_ifname = {
+        nei["port"]: (nei["neighborDevice"], nei["neighborPort"])
+        for nei in cli_lldp_rsp["lldpNeighbors"]
+    }
 
-    dev_lldpnei_ifname = {nei["port"]: nei for nei in cli_lldp_rsp["lldpNeighbors"]}
+    results_append = results.append
+    lldpnei_get = dev_lldpnei_ifname.get
 
-    for check in testcases.checks:
-        if_name = check.check_id()
+    # resolve the check-IDs up front in one tight pass rather than invoking
+    # the method in the middle of the check processing.
 
-        if not (port_nei := dev_lldpnei_ifname.get(if_name)):
+    checks = testcases.checks
+    check_ids = [check.check_id() for check in checks]
+
+    for check, if_name in zip(checks, check_ids):
+        # a device commonly has many more checked interfaces than LLDP
+        # neighbors, so the miss path is the hot one.
+
+        if (port_nei := lldpnei_get(if_name)) is None:
             result = InterfaceCablingCheckResult(
                 device=device, check=check, measurement=None
             )
-            results.append(result.measure())
+            results_append(result.measure())
             continue
 
         _check_one_interface(
@@ -102,7 +129,7 @@ async def eos_check_cabling(
 def _check_one_interface(
     device: Device,
     check: InterfaceCablingCheck,
-    ifnei_status: dict,
+    ifnei_status: tuple,
     results: CheckResultsCollection,
 ):
     """
@@ -111,17 +138,6 @@ def _check_one_interface(
     result = InterfaceCablingCheckResult(device=device, check=check)
     msrd = result.measurement
 
-    msrd.device = ifnei_status["neighborDevice"]
-    msrd.port_id = ifnei_status["neighborPort"]
-
-    def on_mismatch(_field, _expd, _msrd):
-        is_ok = False
-        match _field:
-            case "device":
-                is_ok = nei_hostname_match(_expd, _msrd)
-            case "port_id":
-                is_ok = nei_interface_match(_expd, _msrd)
-
-        return CheckStatus.PASS if is_ok else CheckStatus.FAIL
+    msrd.device, msrd.port_id = ifnei_status
 
-    results.append(result.measure(on_mismatch=on_mismatch))
+    results.append(result.measure(on_mismatch=_on_mismatch))
@@ -65,8 +65,9 @@ async def eos_check_device_info(
     exp_product_model = exp_values.product_model
     has_product_model = ver_info["modelName"]
 
-    check_len = min(len(has_product_model), len(exp_product_model))
-    model_match = has_product_model[:check_len] == exp_product_model[:check_len]
+    model_match = has_product_model.startswith(
+        exp_product_model
+    ) or exp_product_model.startswith(has_product_model)
 
     result = DeviceInformationCheckResult(
         device=dut.device,
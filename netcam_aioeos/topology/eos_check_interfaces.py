@@ -17,9 +17,8 @@
 # System Imports
 # -----------------------------------------------------------------------------
 
-import re
+import asyncio
 from typing import Set
-from itertools import chain
 
 # -----------------------------------------------------------------------------
 # Public Imports
@@ -56,8 +55,6 @@ __all__ = ["eos_check_interfaces", "eos_check_one_interface", "eos_check_one_svi
 #
 # -----------------------------------------------------------------------------
 
-_match_svi = re.compile(r"Vlan(\d+)").match
-
 
 @EOSDeviceUnderTest.execute_checks.register  # noqa
 async def eos_check_interfaces(
@@ -90,20 +87,24 @@ async def eos_check_interfaces(
     results = list()
 
     # read the data from the EOS device for both "show interfaces ..." and "show
-    # vlan ..." since we need both.
-
-    cli_sh_ifaces, cli_sh_vlan, cli_sh_ipinf = await dut.eapi.cli(
-        commands=[
-            "show interfaces status",
-            "show vlan brief",
-            "show ip interface brief",
-        ]
+    # vlan ..." since we need both.  The IP interface data is fetched through
+    # the shared DUT accessor so that the same response is reused by the
+    # ipaddrs executor; gathering runs both requests concurrently.
+
+    (cli_sh_ifaces, cli_sh_vlan), cli_sh_ipinf = await asyncio.gather(
+        dut.eapi.cli(commands=["show interfaces status", "show vlan brief"]),
+        dut.get_ip_interfaces(),
     )
 
     map_if_oper_data: dict = cli_sh_ifaces["interfaceStatuses"]
     map_svi_oper_data: dict = cli_sh_vlan["vlans"]
     map_ip_ifaces: dict = cli_sh_ipinf["interfaces"]
 
+    # resolve each check-ID once; the names are used for the exclusive-list
+    # set below and again for the per-check classification.
+
+    checks_with_ids = [(check, check.check_id()) for check in collection.checks]
+
     # -------------------------------------------------------------------------
     # Check for the exclusive set of interfaces expected vs actual.
     # -------------------------------------------------------------------------
@@ -111,8 +112,8 @@ async def eos_check_interfaces(
     if collection.exclusive:
         eos_check_exclusive_interfaces_list(
             device=device,
-            expd_interfaces=set(check.check_id() for check in collection.checks),
-            msrd_interfaces=set(chain(map_if_oper_data, map_ip_ifaces)),
+            expd_interfaces={if_name for _, if_name in checks_with_ids},
+            msrd_interfaces=map_if_oper_data.keys() | map_ip_ifaces.keys(),
             results=results,
         )
 
@@ -120,50 +121,92 @@ async def eos_check_interfaces(
     # Check each interface for health checks
     # -------------------------------------------------------------------------
 
-    for check in collection.checks:
-        if_name = check.check_id()
-
-        # ---------------------------------------------------------------------
-        # if the interface is an SVI, that it begins with "Vlan", then we need
-        # to examine it differently since it does not show up in the "show
-        # interfaces ..." command.
-        # ---------------------------------------------------------------------
+    # ---------------------------------------------------------------------
+    # Classify the checks by interface kind in one pass; each kind is then
+    # processed in its own tight loop so the kind tests are not re-evaluated
+    # per iteration.  SVIs begin with "Vlan" and need to be examined
+    # differently since they do not show up in the "show interfaces ..."
+    # command; the SVI lookup key is the VLAN ID int-as-string since that is
+    # how the data is encoded in the CLI response object.
+    # ---------------------------------------------------------------------
+
+    svi_checks = list()
+    lo_checks = list()
+    eth_checks = list()
+
+    for check, if_name in checks_with_ids:
+        if if_name.startswith("Vlan") and (vlan_id := if_name[4:]).isdigit():
+            svi_checks.append((check, vlan_id))
+        elif if_name.startswith("Loopback"):
+            lo_checks.append((check, if_name))
+        else:
+            eth_checks.append((check, if_name))
+
+    # bind the per-iteration lookups once; the loop bodies below run for
+    # every interface check on the device.
+
+    if_oper_get = map_if_oper_data.get
+    svi_oper_get = map_svi_oper_data.get
+    ip_iface_get = map_ip_ifaces.get
+    results_append = results.append
+
+    # ---------------------------------------------------------------------
+    # SVI interfaces.  If the VLAN does not exist, or if the VLAN does exist
+    # but there is no Cpu interface, then the "interface Vlan<N>" does not
+    # exist on the device.
+    # ---------------------------------------------------------------------
+
+    for check, vlan_id in svi_checks:
+        eos_check_one_svi(
+            device=device,
+            check=check,
+            svi_oper_status=svi_oper_get(vlan_id),
+            results=results,
+        )
 
-        if vlan_mo := _match_svi(if_name):
-            # extract the VLAN ID value from the interface name; the lookup is
-            # an int-as-string since that is how the data is encoded in the CLI
-            # response object.  If the VLAN does not exist, or if the VLAN does
-            # exist but there is no Cpu interface, then the "interface Vlan<N>"
-            # does not exist on the device.
+    # ---------------------------------------------------------------------
+    # Loopback interfaces.  Those that exist need their description data;
+    # these are deferred so that all of the per-loopback CLI commands go to
+    # the device as one batched request rather than one round-trip each.
+    # ---------------------------------------------------------------------
 
-            vlan_id = vlan_mo.group(1)
+    lo_deferred = list()
 
-            eos_check_one_svi(
-                device=device,
-                check=check,
-                svi_oper_status=map_svi_oper_data.get(vlan_id),
-                results=results,
-            )
+    for check, if_name in lo_checks:
+        result = InterfaceCheckResult(device=device, check=check)
 
-            # done with Vlan interface, go to next test-case
+        if not (lo_status := ip_iface_get(if_name)):
+            result.measurement = None
+            results_append(result.measure())
             continue
 
-        # ---------------------------------------------------------------------
-        # If the interface is a Loopback ...
-        # ---------------------------------------------------------------------
+        lo_deferred.append((if_name, result, lo_status))
 
-        if if_name.startswith("Loopback"):
-            result = InterfaceCheckResult(device=device, check=check)
+    # ---------------------------------------------------------------------
+    # Standard interface checks
+    # ---------------------------------------------------------------------
+
+    for check, if_name in eth_checks:
+        eos_check_one_interface(
+            device=device,
+            check=check,
+            if_name=if_name,
+            iface_oper_status=if_oper_get(if_name),
+            results=results,
+        )
 
-            if not (lo_status := map_ip_ifaces.get(if_name)):
-                result.measurement = None
-                results.append(result.measure())
-                continue
+    if lo_deferred:
+        cli_lo_descs = await dut.eapi.cli(
+            commands=[
+                f"show interfaces {if_name} description"
+                for if_name, _, _ in lo_deferred
+            ]
+        )
 
-            if_desc = await dut.eapi.cli(f"show interfaces {if_name} description")
+        # if the loopback exists, then it is a PASS, and we are not going
+        # to check anything else at this time.
 
-            # if the loopback exists, then it is a PASS, and we are not going
-            # to check anything else at this time.
+        for (if_name, result, lo_status), if_desc in zip(lo_deferred, cli_lo_descs):
             result.measurement.oper_up = lo_status["lineProtocolStatus"] == "up"
             result.measurement.used = True
             result.measurement.desc = if_desc["interfaceDescriptions"][if_name][
@@ -171,20 +214,6 @@ async def eos_check_interfaces(
             ]
             results.append(result)
 
-            # done with Loopback, go to next test-case
-            continue
-
-        # ---------------------------------------------------------------------
-        # If here, then standard interface check
-        # ---------------------------------------------------------------------
-
-        eos_check_one_interface(
-            device=device,
-            check=check,
-            iface_oper_status=map_if_oper_data.get(if_name),
-            results=results,
-        )
-
     return results
 
 
@@ -206,26 +235,47 @@ def eos_check_exclusive_interfaces_list(
     against the expected list in the design.
     """
 
+    # each interface name is sorted multiple times (expected list, measured
+    # list, and again inside measure), so memoize the DeviceInterface keys.
+
+    memo = dict()
+
     def sort_key(i):
-        return DeviceInterface(i, interfaces=device.interfaces)
+        if (key := memo.get(i)) is None:
+            key = memo[i] = DeviceInterface(i, interfaces=device.interfaces)
+        return key
 
-    check = InterfaceExclusiveListCheck(
-        expected_results=sorted(expd_interfaces, key=sort_key)
+    expd_sorted = sorted(expd_interfaces, key=sort_key)
+
+    # in the common no-drift case the measured set is identical to the
+    # expected set, so the expected ordering serves both and the second
+    # N log N sort is skipped entirely.
+
+    msrd_sorted = (
+        expd_sorted
+        if msrd_interfaces == expd_interfaces
+        else sorted(msrd_interfaces, key=sort_key)
     )
 
+    check = InterfaceExclusiveListCheck(expected_results=expd_sorted)
+
     result = InterfaceExclusiveListCheckResult(
-        device=device, check=check, measurement=sorted(msrd_interfaces, key=sort_key)
+        device=device, check=check, measurement=msrd_sorted
     )
 
     results.append(result.measure(sort_key=sort_key))
 
 
+# shared read-only stand-in for checks that carry no interface flags; avoids
+# allocating a fresh empty dict on every per-interface call.
+
+_EMPTY_FLAGS: dict = {}
+
+
 # -----------------------------------------------------------------------------
 # EOS Measurement dataclass
 # -----------------------------------------------------------------------------
 
-BITS_TO_MBS = 10**-6
-
 
 class EosInterfaceMeasurement(InterfaceCheckMeasurement):
     """
@@ -236,17 +286,22 @@ class EosInterfaceMeasurement(InterfaceCheckMeasurement):
     @classmethod
     def from_cli(cls, cli_payload: dict):
         """returns an EOS specific measurement mapping the CLI object fields"""
-        return cls(
+
+        # model_construct skips pydantic validation; the field values below
+        # are already the correct native types straight from the eAPI JSON.
+
+        return cls.model_construct(
             used=cli_payload["linkStatus"] != "disabled",
             oper_up=cli_payload["lineProtocolStatus"] == "up",
             desc=cli_payload["description"],
-            speed=cli_payload["bandwidth"] * BITS_TO_MBS,
+            speed=cli_payload["bandwidth"] // 1_000_000,
         )
 
 
 def eos_check_one_interface(
     device: Device,
     check: InterfaceCheck,
+    if_name: str,
     iface_oper_status: dict,
     results: CheckResultsCollection,
 ):
@@ -263,12 +318,17 @@ def eos_check_one_interface(
         results.append(result.measure())
         return
 
+    # resolve the design flags before transforming the CLI data; the reserved
+    # disposition is known from the flags alone.
+
+    if_flags = check.check_params.interface_flags or _EMPTY_FLAGS
+    is_reserved = if_flags.get("is_reserved", False)
+
     # transform the CLI data into a measurment instance for consistent
-    # comparison with the expected values.
+    # comparison with the expected values.  Both the reserved INFO report and
+    # the standard comparison below need the measurement fields.
 
     measurement = EosInterfaceMeasurement.from_cli(iface_oper_status)
-    if_flags = check.check_params.interface_flags or {}
-    is_reserved = if_flags.get("is_reserved", False)
 
     # -------------------------------------------------------------------------
     # If the interface is marked as reserved, then report the current state in
@@ -279,14 +339,13 @@ def eos_check_one_interface(
         result.status = CheckStatus.INFO
         result.logs.info("reserved", measurement.model_dump())
         results.append(result.measure())
-        return results
+        return
 
     # override the expected condition if there is a forced unused on a port
     if is_forced_unused := if_flags.get("is_forced_unused"):
         check.expected_results.used = False
 
     # see if the port was explicity set to disabled.
-    if_name = check.check_id()
     if device.interfaces[if_name].enabled is False:
         check.expected_results.used = False
 
@@ -331,10 +390,10 @@ def eos_check_one_svi(
 
     result = InterfaceCheckResult(device=device, check=check)
 
-    if not svi_oper_status:
-        result.measurement = None
+    # the SVI interface does not exist when either the VLAN is not present on
+    # the device, or the VLAN exists but has no Cpu interface membership.
 
-    elif not (svi_oper_status or "Cpu" not in svi_oper_status["interfaces"]):
+    if not svi_oper_status or "Cpu" not in svi_oper_status["interfaces"]:
         result.measurement = None
 
     else:
@@ -55,6 +55,17 @@ __all__ = []
 # -----------------------------------------------------------------------------
 
 
+def _active_if_name(item: tuple) -> str | None:
+    """
+    Given a (name, data) item from the IP interface response, return the name
+    when the interface has an assigned IP address, determined by a non-zero
+    mask length; None otherwise.  The dict key is the interface name, so the
+    redundant data["name"] lookup is avoided.
+    """
+    if_name, if_ip_data = item
+    return if_name if if_ip_data["interfaceAddress"]["ipAddr"]["maskLen"] else None
+
+
 @EOSDeviceUnderTest.execute_checks.register  # noqa
 async def eos_test_ipaddrs(
     dut, collection: IPInterfacesCheckCollection
@@ -67,44 +78,83 @@ async def eos_test_ipaddrs(
     dut: EOSDeviceUnderTest
 
     device = dut.device
-    cli_rsp = await dut.eapi.cli("show ip interface brief")
+    cli_rsp = await dut.get_ip_interfaces()
     dev_ips_data = cli_rsp["interfaces"]
 
     results = list()
+
+    # the expected name list only feeds the exclusive-list check; skip
+    # accumulating it when that check is not requested.
+
+    exclusive = collection.exclusive
     if_names = list()
 
+    # resolve the design enabled-interface set once for the whole run rather
+    # than per interface check inside the helper.
+
+    enabled_ifs = dut.design_if_sets[0]
+
+    # SVI interfaces that need the configured-ports examination are deferred
+    # so that all of the per-VLAN CLI commands go to the device as one batched
+    # request after the loop rather than one round-trip per SVI.
+
+    svi_deferred = list()
+
     for check in collection.checks:
         if_name = check.check_id()
-        if_names.append(if_name)
+        if exclusive:
+            if_names.append(if_name)
 
         # if the IP address does not exist, then report that measurement and
-        # move on to the next interface.
+        # move on to the next interface.  every field is given explicitly, so
+        # model_construct safely skips the validation pass here.
 
         if not (if_ip_data := dev_ips_data.get(if_name)):
             results.append(
-                IPInterfaceCheckResult(
+                IPInterfaceCheckResult.model_construct(
                     device=device, check=check, measurement=None
                 ).measure()
             )
             continue
 
-        await eos_test_one_interface(
-            dut, device=device, check=check, msrd_data=if_ip_data, results=results
+        eos_test_one_interface(
+            dut,
+            device=device,
+            check=check,
+            if_name=if_name,
+            msrd_data=if_ip_data,
+            enabled_ifs=enabled_ifs,
+            svi_deferred=svi_deferred,
+            results=results,
+        )
+
+    if svi_deferred:
+        # the names are guaranteed "Vlan<N>" by the deferral site; slice off
+        # the 4-char prefix rather than allocating a split list.
+        vlan_ids = [if_name[4:] for if_name, _ in svi_deferred]
+        cli_rsps = await dut.eapi.cli(
+            commands=[
+                f"show vlan id {vlan_id} configured-ports" for vlan_id in vlan_ids
+            ]
         )
+        for (if_name, result), vlan_id, cli_res in zip(svi_deferred, vlan_ids, cli_rsps):
+            _check_vlan_assoc_interface(
+                dut,
+                vlan_id=vlan_id,
+                cli_res=cli_res,
+                result=result,
+                results=results,
+            )
 
     # only include device interface that have an assigned IP address; this
     # conditional is checked by examining the interface IP address mask length
     # against zero.
 
-    if collection.exclusive:
+    if exclusive:
         eos_test_exclusive_list(
             device=device,
             expd_if_names=if_names,
-            msrd_if_names=[
-                if_ip_data["name"]
-                for if_ip_data in dev_ips_data.values()
-                if if_ip_data["interfaceAddress"]["ipAddr"]["maskLen"] != 0
-            ],
+            msrd_if_names=list(filter(None, map(_active_if_name, dev_ips_data.items()))),
             results=results,
         )
 
@@ -114,11 +164,14 @@ async def eos_test_ipaddrs(
 # -----------------------------------------------------------------------------
 
 
-async def eos_test_one_interface(
+def eos_test_one_interface(
     dut: "EOSDeviceUnderTest",
     device: Device,
     check: IPInterfaceCheck,
+    if_name: str,
     msrd_data: dict,
+    enabled_ifs: frozenset,
+    svi_deferred: list,
     results: CheckResultsCollection,
 ):
     """
@@ -126,7 +179,6 @@ async def eos_test_one_interface(
     the design expectations.
     """
 
-    if_name = check.check_id()
     result = IPInterfaceCheckResult(device=device, check=check)
     msrd = result.measurement
 
@@ -165,23 +217,20 @@ async def eos_test_one_interface(
     # -------------------------------------------------------------------------
 
     # check to see if the interface is disabled before we check to see if the IP
-    # address is in the up condition.
-
-    dut_interfaces = dut.device_info["interfaces"]
-    dut_iface = dut_interfaces[if_name]
-    iface_enabled = dut_iface["enabled"] is True
+    # address is in the up condition.  most interfaces are operationally up,
+    # so that state is tested first; the enabled-set membership runs only on
+    # the down path.
 
-    msrd.oper_up = msrd_data["lineProtocolStatus"] == "up"
+    msrd.oper_up = oper_up = msrd_data["lineProtocolStatus"] == "up"
 
-    if iface_enabled and not msrd.oper_up:
+    if not oper_up and if_name in enabled_ifs:
         # if the interface is an SVI, then we need to check to see if _all_ of
         # the associated physical interfaces are either disabled or in a
-        # reseverd condition.
+        # reseverd condition.  that examination requires another CLI command,
+        # so it is deferred to the caller for batching.
 
         if if_name.startswith("Vlan"):
-            await _check_vlan_assoc_interface(
-                dut, if_name=if_name, result=result, results=results
-            )
+            svi_deferred.append((if_name, result))
             return results
 
     results.append(result.measure())
@@ -202,8 +251,15 @@ def eos_test_exclusive_list(
     # the previous per-interface checks for any missing; therefore we only need
     # to check for any extra interfaces found on the device.
 
+    # memoize the DeviceInterface sort keys; the same names are sorted here
+    # and again inside result.measure().
+
+    memo = dict()
+
     def sort_key(i):
-        return DeviceInterface(i, interfaces=device.interfaces)
+        if (key := memo.get(i)) is None:
+            key = memo[i] = DeviceInterface(i, interfaces=device.interfaces)
+        return key
 
     result = IPInterfaceExclusiveListCheckResult(
         device=device,
@@ -213,9 +269,10 @@ def eos_test_exclusive_list(
     results.append(result.measure())
 
 
-async def _check_vlan_assoc_interface(
+def _check_vlan_assoc_interface(
     dut: EOSDeviceUnderTest,
-    if_name: str,
+    vlan_id: str,
+    cli_res: dict,
     result: IPInterfaceCheckResult,
     results: CheckResultsCollection,
 ):
@@ -231,32 +288,35 @@ async def _check_vlan_assoc_interface(
     dut:
         The device under test
 
+    vlan_id:
+        The VLAN ID of the SVI, "12" for "Vlan12" as an example.
+
+    cli_res:
+        The CLI response object for "show vlan id <vlan_id> configured-ports";
+        fetched by the caller as part of a batched eAPI request.
+
     result:
         The result instance bound to the check
 
-    if_name:
-        The specific VLAN SVI name, "Vlan12" for example:
-
     Yields
     ------
     netcad test case results; one or more depending on the condition of SVI
     interfaces.
     """
 
-    vlan_id = if_name.split("Vlan")[-1]
-    cli_res = await dut.eapi.cli(f"show vlan id {vlan_id} configured-ports")
-    vlan_cfgd_ifnames = set(cli_res["vlans"][vlan_id]["interfaces"])
-    disrd_ifnames = set()
-    dut_ifs = dut.device_info["interfaces"]
+    vlan_cfgd_ifnames = cli_res["vlans"][vlan_id]["interfaces"]
+    enabled_ifs, reserved_ifs = dut.design_if_sets
+
+    # the PASS disposition applies only when every configured port is either
+    # disabled or reserved in the design; all() exits at the first active
+    # port, avoiding both the full scan and the disregarded-set construction.
 
-    for check_ifname in vlan_cfgd_ifnames:
-        dut_iface = dut_ifs[check_ifname]
-        if (dut_iface["enabled"] is False) or (
-            "is_reserved" in dut_iface["profile_flags"]
-        ):
-            disrd_ifnames.add(check_ifname)
+    all_disregarded = all(
+        (if_name not in enabled_ifs) or (if_name in reserved_ifs)
+        for if_name in vlan_cfgd_ifnames
+    )
 
-    if disrd_ifnames == vlan_cfgd_ifnames:
+    if all_disregarded:
         # then the SVI check should be a PASS because of the conditions
         # mentioned.
 
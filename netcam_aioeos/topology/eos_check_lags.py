@@ -16,8 +16,7 @@
 # System Imports
 # -----------------------------------------------------------------------------
 
-from collections import defaultdict
-from itertools import chain
+from typing import Callable
 
 # -----------------------------------------------------------------------------
 # Public Imports
@@ -64,6 +63,18 @@ async def eos_check_lags(self, testcases: LagCheckCollection) -> CheckResultsCol
 
     results = list()
 
+    # memoize the DeviceInterface sort keys across all the LAG checks in this
+    # run; a member interface ordering key is then constructed at most once.
+
+    memo = dict()
+
+    def if_sort_key(_ifname):
+        if (key := memo.get(_ifname)) is None:
+            key = memo[_ifname] = DeviceInterface(
+                _ifname, interfaces=device.interfaces
+            )
+        return key
+
     for check in testcases.checks:
         # The test case ID is the port-channel interface name.
         if_name = check.check_id()
@@ -77,14 +88,22 @@ async def eos_check_lags(self, testcases: LagCheckCollection) -> CheckResultsCol
             continue
 
         eos_check_one_lag(
-            device=device, check=check, lag_status=lag_status, results=results
+            device=device,
+            check=check,
+            lag_status=lag_status,
+            sort_key=if_sort_key,
+            results=results,
         )
 
     return results
 
 
 def eos_check_one_lag(
-    device: Device, check: LagCheck, lag_status: dict, results: CheckResultsCollection
+    device: Device,
+    check: LagCheck,
+    lag_status: dict,
+    sort_key: Callable,
+    results: CheckResultsCollection,
 ):
     """
     Validates the checks for one specific LAG on the device.
@@ -96,23 +115,15 @@ def eos_check_one_lag(
     msrd = result.measurement
 
     # -------------------------------------------------------------------------
-    # check the interface bundle status.  we will use a defaultdict-list to find
-    # any non-bundled values.
+    # check the interface bundle status.  only the interfaces in a non-bundled
+    # state are of interest, so collect those in a single pass; they will be
+    # reported as a failure.
     # -------------------------------------------------------------------------
 
-    bundle_status = defaultdict(list)
-    for if_name, if_data in po_interfaces.items():
-        bundle_status[if_data["actorPortStatus"]].append(if_name)
-
-    # add the default=None in case no interfaces are bundled.
-    bundle_status.pop("bundled", None)
-
-    # if there are any keys remaining in the bundled_status dictionary this
-    # means that there are interfaces in a non bundled state.  Need to report
-    # this as a failure.
-
     iface_unbundled_state = {
-        if_name: False for if_name in list(chain.from_iterable(bundle_status.values()))
+        if_name: False
+        for if_name, if_data in po_interfaces.items()
+        if if_data["actorPortStatus"] != "bundled"
     }
 
     lag_down = len(iface_unbundled_state) == len(po_interfaces)
@@ -127,10 +138,7 @@ def eos_check_one_lag(
         LagCheckExpectedInterfaceStatus(
             enabled=iface_unbundled_state.get(if_name, True), interface=if_name
         )
-        for if_name in sorted(
-            po_interfaces,
-            key=lambda _ifname: DeviceInterface(_ifname, interfaces=device.interfaces),
-        )
+        for if_name in sorted(po_interfaces, key=sort_key)
     ]
 
     results.append(result.measure())
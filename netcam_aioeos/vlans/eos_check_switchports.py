@@ -196,10 +196,15 @@ def _check_trunk_switchport(
 
         _expd_v_set = set(expd_allowed_vids)
         _info = dict()
-        if _missing := _expd_v_set - _msrd_v_set:
-            _info["missing"] = list(_missing)
-        if _extra := _msrd_v_set - _expd_v_set:
-            _info["extra"] = list(_extra)
+
+        # split one symmetric difference rather than computing both one-way
+        # differences over the full sets.
+
+        if _drift := _expd_v_set ^ _msrd_v_set:
+            if _missing := _drift & _expd_v_set:
+                _info["missing"] = list(_missing)
+            if _extra := _drift - _expd_v_set:
+                _info["extra"] = list(_extra)
 
         result.logs.info("trunk_allowed_vlans_mismatch", _info)
 